@@ -22,7 +22,9 @@ def display_menu():
     print("4. Mark task as complete")
     print("5. View statistics & score")
     print("6. Delete task")
-    print("7. Exit")
+    print("7. Undo last change")
+    print("8. Redo")
+    print("9. Exit")
     print("="*50)
 
 def main():
@@ -30,7 +32,7 @@ def main():
     
     while True:
         display_menu()
-        choice = input("Choose menu (1-7): ").strip()
+        choice = input("Choose menu (1-9): ").strip()
         
         if choice == '1':
             clear_screen()
@@ -139,11 +141,25 @@ def main():
                 print("❌ Invalid input!")
                 
         elif choice == '7':
+            undone = task_manager.undo()
+            if undone:
+                print(f"↩️ Undone: {undone}")
+            else:
+                print("❌ Nothing to undo!")
+                
+        elif choice == '8':
+            redone = task_manager.redo()
+            if redone:
+                print(f"↪️ Redone: {redone}")
+            else:
+                print("❌ Nothing to redo!")
+                
+        elif choice == '9':
             print("👋 Thank you for using Pomodoro To-Do Helper!")
             sys.exit(0)
             
         else:
-            print("❌ Invalid choice! Please select 1-7.")
+            print("❌ Invalid choice! Please select 1-9.")
             
         input("\nPress Enter to continue...")
 
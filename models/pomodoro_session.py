@@ -168,7 +168,7 @@ class PomodoroSession:
                     self.task.add_focus_session(self.work_duration // 2, 3)  # Average rating
                 else:
                     self.task.add_pomodoro_session()
-                self.task_manager.save_data()
+                self.task_manager.update_task(self.task.task_id)
                 print("💾 Progress saved!")
         except Exception as e:
             print(f"❌ Error during Pomodoro session: {e}")
@@ -0,0 +1,83 @@
+import json
+import mmap
+import os
+from typing import Dict, Any, Optional
+from .task_manager import calculate_level, HEADER_SIZE, HEADER_PREFIX
+
+
+def parse_header(block: bytes) -> Optional[Dict[str, Any]]:
+    """Parse the summary from the first HEADER_SIZE bytes of a data file"""
+    if not block.startswith(HEADER_PREFIX.encode('utf-8')):
+        return None
+    text = block.rstrip().decode('utf-8')
+    if not text.endswith(','):
+        return None
+    try:
+        return json.loads(text[:-1] + '}')['summary']
+    except (ValueError, KeyError):
+        return None
+
+
+class StatsReader:
+    """Read-only access to user stats and task counts without loading any tasks"""
+
+    def __init__(self, data_file="data/tasks.json"):
+        self.data_file = data_file
+        self.from_header = False
+        self.summary = self._read_summary()  # None if the file is missing or unreadable
+
+    def is_available(self) -> bool:
+        """Check if stats could be read from the data file"""
+        return self.summary is not None
+
+    def _read_summary(self) -> Optional[Dict[str, Any]]:
+        """Read the summary from the header, scanning the whole file if it is missing"""
+        if not os.path.exists(self.data_file):
+            return None
+
+        try:
+            with open(self.data_file, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    summary = parse_header(mm[:HEADER_SIZE])
+        except (OSError, ValueError, UnicodeDecodeError):
+            summary = None  # Empty or unreadable file
+
+        if summary is not None:
+            self.from_header = True
+            return summary
+        return self._scan_summary()
+
+    def _scan_summary(self) -> Optional[Dict[str, Any]]:
+        """Build the summary by parsing the whole data file (None if unreadable)"""
+        try:
+            with open(self.data_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception:
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        tasks = data.get('tasks', [])
+        completed = sum(1 for task in tasks if task.get('completed'))
+        return {
+            'user_stats': data.get('user_stats', {}),
+            'counts': {
+                'tasks': len(tasks),
+                'pending': len(tasks) - completed,
+                'completed': completed
+            }
+        }
+
+    def get_user_stats(self) -> Optional[Dict[str, Any]]:
+        """Get the stored user stats (None if unavailable)"""
+        return self.summary['user_stats'] if self.summary else None
+
+    def get_counts(self) -> Optional[Dict[str, int]]:
+        """Get the number of total, pending and completed tasks (None if unavailable)"""
+        return self.summary['counts'] if self.summary else None
+
+    def get_user_level(self) -> Optional[Dict[str, Any]]:
+        """Calculate user level based on the stored points (None if unavailable)"""
+        if not self.summary:
+            return None
+        return calculate_level(self.get_user_stats().get('total_points', 0))
@@ -0,0 +1,286 @@
+import copy
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+_HASH_BITS = 64
+
+
+def _hash(key):
+    """Hash a key to a fixed number of bits"""
+    return hash(key) & ((1 << _HASH_BITS) - 1)
+
+
+def _slot(bitmap, bit):
+    """Position of a bit's entry among the entries present in a bitmap"""
+    return bin(bitmap & (bit - 1)).count('1')
+
+
+def _merge_entries(entry, entry_hash, other, other_hash, shift):
+    """Build the smallest subtree holding two entries whose hashes share a prefix"""
+    if shift >= _HASH_BITS:
+        return _Collision((entry, other))
+    index = (entry_hash >> shift) & _MASK
+    other_index = (other_hash >> shift) & _MASK
+    if index == other_index:
+        child = _merge_entries(entry, entry_hash, other, other_hash, shift + _BITS)
+        return _Node(1 << index, (child,))
+    if index < other_index:
+        return _Node((1 << index) | (1 << other_index), (entry, other))
+    return _Node((1 << index) | (1 << other_index), (other, entry))
+
+
+class _Node:
+    """Immutable trie node: a 32-bit bitmap plus the entries present in it"""
+
+    __slots__ = ('bitmap', 'entries')
+
+    def __init__(self, bitmap, entries):
+        self.bitmap = bitmap
+        self.entries = entries  # (key, value) pairs or child nodes
+
+    def get(self, shift, key_hash, key):
+        """Find the value stored for key (None if missing)"""
+        bit = 1 << ((key_hash >> shift) & _MASK)
+        if not self.bitmap & bit:
+            return None
+        entry = self.entries[_slot(self.bitmap, bit)]
+        if isinstance(entry, tuple):
+            return entry[1] if entry[0] == key else None
+        return entry.get(shift + _BITS, key_hash, key)
+
+    def assoc(self, shift, key_hash, key, value):
+        """Return (new node with key set to value, whether key was added)"""
+        bit = 1 << ((key_hash >> shift) & _MASK)
+        index = _slot(self.bitmap, bit)
+        if not self.bitmap & bit:
+            entries = self.entries[:index] + ((key, value),) + self.entries[index:]
+            return _Node(self.bitmap | bit, entries), True
+
+        entry = self.entries[index]
+        if isinstance(entry, tuple):
+            if entry[0] == key:
+                new_entry, added = (key, value), False
+            else:
+                new_entry = _merge_entries(entry, _hash(entry[0]), (key, value), key_hash, shift + _BITS)
+                added = True
+        else:
+            new_entry, added = entry.assoc(shift + _BITS, key_hash, key, value)
+        entries = self.entries[:index] + (new_entry,) + self.entries[index + 1:]
+        return _Node(self.bitmap, entries), added
+
+    def without(self, shift, key_hash, key):
+        """Return the node without key: itself if missing, a lone pair to inline, or None if empty"""
+        bit = 1 << ((key_hash >> shift) & _MASK)
+        if not self.bitmap & bit:
+            return self
+        index = _slot(self.bitmap, bit)
+        entry = self.entries[index]
+        if isinstance(entry, tuple):
+            if entry[0] != key:
+                return self
+            new_entry = None
+        else:
+            new_entry = entry.without(shift + _BITS, key_hash, key)
+            if new_entry is entry:
+                return self
+
+        if new_entry is None:
+            if len(self.entries) == 1:
+                return None
+            entries = self.entries[:index] + self.entries[index + 1:]
+            bitmap = self.bitmap & ~bit
+        else:
+            entries = self.entries[:index] + (new_entry,) + self.entries[index + 1:]
+            bitmap = self.bitmap
+        if len(entries) == 1 and isinstance(entries[0], tuple):
+            return entries[0]  # Collapse so deletes never leave chains of tiny nodes
+        return _Node(bitmap, entries)
+
+    def items(self):
+        """Yield every (key, value) pair below this node"""
+        for entry in self.entries:
+            if isinstance(entry, tuple):
+                yield entry
+            else:
+                yield from entry.items()
+
+
+class _Collision:
+    """Bucket for keys whose full hashes are equal"""
+
+    __slots__ = ('entries',)
+
+    def __init__(self, entries):
+        self.entries = entries
+
+    def get(self, shift, key_hash, key):
+        """Find the value stored for key (None if missing)"""
+        for entry_key, value in self.entries:
+            if entry_key == key:
+                return value
+        return None
+
+    def assoc(self, shift, key_hash, key, value):
+        """Return (new bucket with key set to value, whether key was added)"""
+        for index, (entry_key, _) in enumerate(self.entries):
+            if entry_key == key:
+                return _Collision(self.entries[:index] + ((key, value),) + self.entries[index + 1:]), False
+        return _Collision(self.entries + ((key, value),)), True
+
+    def without(self, shift, key_hash, key):
+        """Return the bucket without key, or the lone pair left over"""
+        entries = tuple(entry for entry in self.entries if entry[0] != key)
+        if len(entries) == len(self.entries):
+            return self
+        return entries[0] if len(entries) == 1 else _Collision(entries)
+
+    def items(self):
+        """Yield every (key, value) pair in the bucket"""
+        return iter(self.entries)
+
+
+_EMPTY_NODE = _Node(0, ())
+
+
+class PersistentTaskMap:
+    """Immutable task_id -> task record map; each change path-copies O(log32 n) trie nodes"""
+
+    __slots__ = ('_root', '_length', '_next_order')
+
+    def __init__(self, root=_EMPTY_NODE, length=0, next_order=0):
+        self._root = root
+        self._length = length
+        self._next_order = next_order  # Keeps records in the order tasks were added
+
+    @classmethod
+    def from_records(cls, records):
+        """Build a map from an iterable of task records"""
+        task_map = cls()
+        for record in records:
+            task_map = task_map.set(record)
+        return task_map
+
+    def __len__(self):
+        """Number of tasks in the map"""
+        return self._length
+
+    def __contains__(self, task_id):
+        """Check if a task is in the map"""
+        return self.get(task_id) is not None
+
+    def __iter__(self):
+        """Iterate over the task records in the order they were added"""
+        entries = sorted((value for _, value in self._root.items()), key=lambda entry: entry[0])
+        for _, record in entries:
+            yield record
+
+    def get(self, task_id) -> Optional[Dict[str, Any]]:
+        """Get the record of a task (None if missing)"""
+        entry = self._root.get(0, _hash(task_id), task_id)
+        return entry[1] if entry else None
+
+    def set(self, record):
+        """Return a new map with the task record added or replaced"""
+        task_id = record['task_id']
+        key_hash = _hash(task_id)
+        existing = self._root.get(0, key_hash, task_id)
+        order = existing[0] if existing else self._next_order
+        root, added = self._root.assoc(0, key_hash, task_id, (order, record))
+        return PersistentTaskMap(root, self._length + added, self._next_order + added)
+
+    def delete(self, task_id):
+        """Return a new map without the task"""
+        key_hash = _hash(task_id)
+        root = self._root.without(0, key_hash, task_id)
+        if root is self._root:
+            return self
+        if root is None:
+            root = _EMPTY_NODE
+        elif isinstance(root, tuple):
+            root, _ = _EMPTY_NODE.assoc(0, _hash(root[0]), root[0], root[1])
+        return PersistentTaskMap(root, self._length - 1, self._next_order)
+
+
+class Snapshot:
+    """A single point-in-time version of the tasks and user stats"""
+
+    __slots__ = ('version', 'label', 'timestamp', 'tasks', 'user_stats')
+
+    def __init__(self, version, label, tasks, user_stats):
+        self.version = version
+        self.label = label
+        self.timestamp = datetime.now().isoformat()
+        self.tasks = tasks
+        self.user_stats = user_stats
+
+
+def freeze_task(task) -> Dict[str, Any]:
+    """Create a record of a task that later changes to the task cannot affect"""
+    return copy.deepcopy(task.to_dict())
+
+
+class TaskHistory:
+    """Bounded undo/redo history of TaskManager versions"""
+
+    def __init__(self, max_versions=50):
+        if max_versions < 1:
+            raise ValueError("max_versions must be at least 1")
+        self.max_versions = max_versions
+        self._versions: List[Snapshot] = []
+        self._position = -1  # Index of the current version
+        self._next_version = 0
+
+    @property
+    def current(self) -> Optional[Snapshot]:
+        """Get the current version"""
+        if self._position < 0:
+            return None
+        return self._versions[self._position]
+
+    def commit(self, label: str, tasks: PersistentTaskMap, user_stats: Dict[str, Any]) -> Snapshot:
+        """Record a new version, dropping any redo versions and the oldest ones past the limit"""
+        snapshot = Snapshot(self._next_version, label, tasks, dict(user_stats))
+        self._next_version += 1
+
+        del self._versions[self._position + 1:]
+        self._versions.append(snapshot)
+        if len(self._versions) > self.max_versions:
+            del self._versions[:len(self._versions) - self.max_versions]
+        self._position = len(self._versions) - 1
+        return snapshot
+
+    def can_undo(self) -> bool:
+        """Check if there is an older version to go back to"""
+        return self._position > 0
+
+    def can_redo(self) -> bool:
+        """Check if there is an undone version to go forward to"""
+        return self._position < len(self._versions) - 1
+
+    def undo(self) -> Optional[Snapshot]:
+        """Step back one version and return it"""
+        if not self.can_undo():
+            return None
+        self._position -= 1
+        return self._versions[self._position]
+
+    def redo(self) -> Optional[Snapshot]:
+        """Step forward one version and return it"""
+        if not self.can_redo():
+            return None
+        self._position += 1
+        return self._versions[self._position]
+
+    def get_versions(self) -> List[Snapshot]:
+        """Get all retained versions, oldest first"""
+        return list(self._versions)
+
+    def get_version(self, version: int) -> Optional[Snapshot]:
+        """Get a retained version by its number"""
+        for snapshot in self._versions:
+            if snapshot.version == version:
+                return snapshot
+        return None
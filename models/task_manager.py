@@ -1,13 +1,63 @@
+import copy
 import json
 import os
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from .task import Task, PomodoroTask
+from .task_history import TaskHistory, PersistentTaskMap, freeze_task
+
+# The data file starts with a fixed-size block holding the summary as the first
+# JSON key, padded with spaces so it can be read without parsing any tasks:
+#   {"summary": {...},<spaces>\n
+#     "tasks": [...], ...}
+HEADER_SIZE = 1024
+HEADER_PREFIX = '{"summary": '
+
+
+def build_header(summary: Dict[str, Any]) -> Optional[str]:
+    """Build the fixed-size summary header (None if the summary does not fit)"""
+    header = HEADER_PREFIX + json.dumps(summary, ensure_ascii=False) + ','
+    padding = HEADER_SIZE - 1 - len(header.encode('utf-8'))
+    if padding < 0:
+        return None
+    return header + ' ' * padding + '\n'
+
+
+def calculate_level(points: int) -> Dict[str, Any]:
+    """Calculate level information for a given amount of points"""
+    if points < 10:
+        level = 1
+        level_name = "Beginner 🌱"
+        next_level_points = 10
+    elif points < 25:
+        level = 2
+        level_name = "Developing 🌿"
+        next_level_points = 25
+    elif points < 50:
+        level = 3
+        level_name = "Productive 🌳"
+        next_level_points = 50
+    elif points < 100:
+        level = 4
+        level_name = "Master 🏆"
+        next_level_points = 100
+    else:
+        level = 5
+        level_name = "Grandmaster 👑"
+        next_level_points = points  # Max level reached
+    
+    return {
+        'level': level,
+        'name': level_name,
+        'current_points': points,
+        'next_level_points': next_level_points,
+        'progress': min(100, (points / next_level_points) * 100) if next_level_points > points else 100
+    }
 
 class TaskManager:
     """Manages all tasks and handles data persistence"""
     
-    def __init__(self, data_file="data/tasks.json"):
+    def __init__(self, data_file="data/tasks.json", history_size=50):
         self.data_file = data_file
         self.tasks: List[Task] = []
         self.user_stats = {
@@ -19,6 +69,8 @@ class TaskManager:
         }
         self._ensure_data_directory()
         self.load_data()
+        self.history = TaskHistory(history_size)
+        self._record("Load data", PersistentTaskMap.from_records(freeze_task(task) for task in self.tasks))
     
     def _ensure_data_directory(self):
         """Create data directory if it doesn't exist"""
@@ -32,6 +84,7 @@ class TaskManager:
             task = Task(title, description, difficulty)
         
         self.tasks.append(task)
+        self._record(f"Add '{title}'", self.history.current.tasks.set(freeze_task(task)))
         self.save_data()
         return task
     
@@ -50,6 +103,7 @@ class TaskManager:
             self.user_stats['completed_tasks'] += 1
             self.user_stats['total_points'] += task.get_points()
             self.user_stats['last_activity'] = datetime.now().isoformat()
+            self._record_task_change(f"Complete '{task.title}'", task)
             self.save_data()
             return True
         return False
@@ -59,6 +113,7 @@ class TaskManager:
         task = self.get_task_by_id(task_id)
         if task:
             self.tasks.remove(task)
+            self._record(f"Delete '{task.title}'", self.history.current.tasks.delete(task.task_id))
             self.save_data()
             return True
         return False
@@ -82,40 +137,82 @@ class TaskManager:
             task.add_pomodoro_session()
             self.user_stats['total_pomodoros'] += 1
             self.user_stats['last_activity'] = datetime.now().isoformat()
+            self._record_task_change(f"Pomodoro on '{task.title}'", task)
             self.save_data()
     
-    def get_user_level(self) -> Dict[str, Any]:
-        """Calculate user level based on points"""
-        points = self.user_stats['total_points']
+    def update_task(self, task_id: str) -> bool:
+        """Record changes made directly on a task object and save them"""
+        task = self.get_task_by_id(task_id)
+        if task:
+            self._record_task_change(f"Update '{task.title}'", task)
+            self.save_data()
+            return True
+        return False
+    
+    def _record(self, label: str, tasks: PersistentTaskMap):
+        """Commit a new history version with the given tasks and current stats"""
+        self.history.commit(label, tasks, self.user_stats)
+    
+    def _record_task_change(self, label: str, task: Task):
+        """Commit a new history version where only the given task changed"""
+        self._record(label, self.history.current.tasks.set(freeze_task(task)))
+    
+    def _restore(self, snapshot):
+        """Replace tasks and stats with the state of a history version"""
+        # Reuse existing task objects so references held elsewhere stay live
+        existing = {task.task_id: task for task in self.tasks}
+        tasks = []
+        for record in snapshot.tasks:
+            restored = self._task_from_dict(copy.deepcopy(record))
+            task = existing.get(restored.task_id)
+            if type(task) is type(restored):
+                task.__dict__.update(restored.__dict__)
+                restored = task
+            tasks.append(restored)
+        self.tasks = tasks
+        self.user_stats = dict(snapshot.user_stats)
+        self.save_data()
+    
+    def undo(self) -> str:
+        """Undo the last change, returning its label (None if nothing to undo)
         
-        if points < 10:
-            level = 1
-            level_name = "Beginner 🌱"
-            next_level_points = 10
-        elif points < 25:
-            level = 2
-            level_name = "Developing 🌿"
-            next_level_points = 25
-        elif points < 50:
-            level = 3
-            level_name = "Productive 🌳"
-            next_level_points = 50
-        elif points < 100:
-            level = 4
-            level_name = "Master 🏆"
-            next_level_points = 100
-        else:
-            level = 5
-            level_name = "Grandmaster 👑"
-            next_level_points = points  # Max level reached
+        Task objects that exist in both versions are updated in place, so
+        references held elsewhere stay valid; tasks that no longer exist after
+        the undo are detached and changes made on them are not saved.
+        """
+        undone = self.history.current
+        snapshot = self.history.undo()
+        if snapshot is None:
+            return None
+        self._restore(snapshot)
+        return undone.label
+    
+    def redo(self) -> str:
+        """Redo the last undone change, returning its label (None if nothing to redo)
         
-        return {
-            'level': level,
-            'name': level_name,
-            'current_points': points,
-            'next_level_points': next_level_points,
-            'progress': min(100, (points / next_level_points) * 100) if next_level_points > points else 100
-        }
+        Task objects are kept the same way as in undo().
+        """
+        snapshot = self.history.redo()
+        if snapshot is None:
+            return None
+        self._restore(snapshot)
+        return snapshot.label
+    
+    def get_stats_at(self, version: int) -> Dict[str, Any]:
+        """Get user stats as they were at a retained history version"""
+        snapshot = self.history.get_version(version)
+        return dict(snapshot.user_stats) if snapshot else None
+    
+    def get_tasks_at(self, version: int) -> List[Task]:
+        """Get tasks as they were at a retained history version"""
+        snapshot = self.history.get_version(version)
+        if snapshot is None:
+            return None
+        return [self._task_from_dict(copy.deepcopy(record)) for record in snapshot.tasks]
+    
+    def get_user_level(self) -> Dict[str, Any]:
+        """Calculate user level based on points"""
+        return calculate_level(self.user_stats['total_points'])
     
     def display_all_tasks(self):
         """Display all tasks in a formatted way"""
@@ -183,6 +280,18 @@ class TaskManager:
             print(f"  🟡 Medium: {difficulties['medium']}")
             print(f"  🔴 Hard: {difficulties['hard']}")
     
+    def get_summary(self) -> Dict[str, Any]:
+        """Get user stats and task counts as stored in the data file header"""
+        completed = len(self.get_completed_tasks())
+        return {
+            'user_stats': self.user_stats,
+            'counts': {
+                'tasks': len(self.tasks),
+                'pending': len(self.tasks) - completed,
+                'completed': completed
+            }
+        }
+    
     def save_data(self):
         """Save tasks and stats to JSON file"""
         data = {
@@ -192,11 +301,25 @@ class TaskManager:
         }
         
         try:
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            content = json.dumps(data, indent=2, ensure_ascii=False)
+            # Prepend the summary header so StatsReader can skip parsing tasks
+            header = build_header(self.get_summary())
+            if header:
+                content = header + content[1:]
+            # Write a temp file and swap it in, so readers never see a half-written file
+            temp_file = self.data_file + '.tmp'
+            with open(temp_file, 'w', encoding='utf-8', newline='\n') as f:
+                f.write(content)
+            os.replace(temp_file, self.data_file)
         except Exception as e:
             print(f"❌ Error saving data: {e}")
     
+    def _task_from_dict(self, task_data: Dict[str, Any]) -> Task:
+        """Create the right task type from a dictionary"""
+        if task_data.get('type') == 'PomodoroTask':
+            return PomodoroTask.from_dict(task_data)
+        return Task.from_dict(task_data)
+    
     def load_data(self):
         """Load tasks and stats from JSON file"""
         try:
@@ -211,11 +334,7 @@ class TaskManager:
                 # Load tasks
                 self.tasks = []
                 for task_data in data.get('tasks', []):
-                    if task_data.get('type') == 'PomodoroTask':
-                        task = PomodoroTask.from_dict(task_data)
-                    else:
-                        task = Task.from_dict(task_data)
-                    self.tasks.append(task)
+                    self.tasks.append(self._task_from_dict(task_data))
                     
         except Exception as e:
             print(f"⚠️ Error loading data: {e}")
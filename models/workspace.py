@@ -0,0 +1,138 @@
+import os
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional
+from .task_manager import TaskManager
+from .stats_reader import StatsReader
+
+
+def _summarize_shard(data_file: str) -> Optional[Dict[str, Any]]:
+    """Read the user stats of a single shard (None if unreadable, runs inside a worker process)"""
+    reader = StatsReader(data_file)
+    if not reader.is_available():
+        return None
+    stats = reader.get_user_stats()
+    level_info = reader.get_user_level()
+    return {
+        'total_points': level_info['current_points'],
+        'completed_tasks': stats.get('completed_tasks', 0),
+        'total_pomodoros': stats.get('total_pomodoros', 0),
+        'level': level_info['level'],
+        'level_name': level_info['name']
+    }
+
+
+class Workspace:
+    """Manages one TaskManager data file (shard) per user under a shared root"""
+
+    SHARD_EXTENSION = ".json"
+
+    def __init__(self, root="data/users", max_open_managers=32, max_workers=None, parallel_threshold=16):
+        self.root = root
+        self.max_open_managers = max_open_managers
+        self.max_workers = max_workers
+        self.parallel_threshold = parallel_threshold  # Fewer stale shards are read in-process
+        self._managers: "OrderedDict[str, TaskManager]" = OrderedDict()
+        # Evicted managers still referenced by callers, so a shard never gets two writers
+        self._evicted_managers = weakref.WeakValueDictionary()
+        self._summary_cache: Dict[str, Any] = {}  # user_id -> (mtime_ns, summary)
+        os.makedirs(self.root, exist_ok=True)
+
+    def _shard_path(self, user_id: str) -> str:
+        """Get the data file path for a user"""
+        if not user_id or os.sep in user_id or (os.altsep and os.altsep in user_id) or user_id.startswith('.'):
+            raise ValueError(f"Invalid user id: {user_id!r}")
+        return os.path.join(self.root, user_id + self.SHARD_EXTENSION)
+
+    def get_users(self) -> List[str]:
+        """Get the ids of all users that have a shard"""
+        return sorted(user_id for user_id, _, _ in self._scan_shards())
+
+    def get_manager(self, user_id: str) -> TaskManager:
+        """Get (and lazily open) the TaskManager of a user"""
+        manager = self._managers.get(user_id)
+        if manager is not None:
+            self._managers.move_to_end(user_id)
+            return manager
+
+        manager = self._evicted_managers.pop(user_id, None)
+        if manager is None:
+            manager = TaskManager(self._shard_path(user_id))
+        self._managers[user_id] = manager
+        # TaskManager saves after every change, so evicted managers need no flush.
+        # They are only tracked weakly: a caller still holding one gets it back above
+        # instead of a second TaskManager overwriting the same shard.
+        while len(self._managers) > self.max_open_managers:
+            evicted_id, evicted = self._managers.popitem(last=False)
+            self._evicted_managers[evicted_id] = evicted
+        return manager
+
+    def _scan_shards(self):
+        """Yield (user_id, path, mtime_ns) for every shard under the root"""
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(self.SHARD_EXTENSION):
+                    user_id = entry.name[:-len(self.SHARD_EXTENSION)]
+                    yield user_id, entry.path, entry.stat().st_mtime_ns
+
+    def get_summaries(self) -> Dict[str, Dict[str, Any]]:
+        """Get stats of every user, re-reading only shards changed since the last call"""
+        shards = list(self._scan_shards())
+        stale = []
+        for user_id, path, mtime in shards:
+            cached = self._summary_cache.get(user_id)
+            if cached is None or cached[0] != mtime:
+                stale.append((user_id, path, mtime))
+
+        if stale:
+            paths = [path for _, path, _ in stale]
+            if len(stale) >= self.parallel_threshold:
+                chunksize = max(1, len(paths) // ((self.max_workers or os.cpu_count() or 1) * 4))
+                with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                    results = list(executor.map(_summarize_shard, paths, chunksize=chunksize))
+            else:
+                results = [_summarize_shard(path) for path in paths]
+
+            # Unreadable shards keep their last good entry (if any) and are retried next time
+            for (user_id, _, mtime), summary in zip(stale, results):
+                if summary is not None:
+                    self._summary_cache[user_id] = (mtime, summary)
+
+        # Forget users whose shard was removed
+        present = {user_id for user_id, _, _ in shards}
+        for user_id in list(self._summary_cache):
+            if user_id not in present:
+                del self._summary_cache[user_id]
+
+        return {user_id: summary for user_id, (_, summary) in self._summary_cache.items()}
+
+    def get_leaderboard(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get users ranked by total points"""
+        ranking = [dict(summary, user_id=user_id) for user_id, summary in self.get_summaries().items()]
+        ranking.sort(key=lambda entry: (-entry['total_points'], entry['user_id']))
+        return ranking[:limit] if limit is not None else ranking
+
+    def get_team_pomodoros(self) -> int:
+        """Get the total number of pomodoros across all users"""
+        return sum(summary['total_pomodoros'] for summary in self.get_summaries().values())
+
+    def get_level_distribution(self) -> Dict[str, int]:
+        """Count how many users are at each level"""
+        distribution: Dict[str, int] = {}
+        for summary in self.get_summaries().values():
+            distribution[summary['level_name']] = distribution.get(summary['level_name'], 0) + 1
+        return distribution
+
+    def display_leaderboard(self, limit: int = 10):
+        """Display the team leaderboard in a formatted way"""
+        leaderboard = self.get_leaderboard(limit)
+        if not leaderboard:
+            print("📭 No users in this workspace yet!")
+            return
+
+        print("🏆 TEAM LEADERBOARD")
+        print("=" * 40)
+        for rank, entry in enumerate(leaderboard, 1):
+            print(f"{rank:>3}. {entry['user_id']} - {entry['total_points']} points ({entry['level_name']})")
+        print(f"\n🍅 Team Pomodoros: {self.get_team_pomodoros()}")